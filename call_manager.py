@@ -4,10 +4,9 @@ Twilio call management — initiating outbound calls and controlling them.
 
 import asyncio
 import logging
-from functools import partial
+from xml.sax.saxutils import quoteattr
 
 from twilio.rest import Client
-from twilio.twiml.voice_response import VoiceResponse, Connect
 
 from config import (
     TWILIO_ACCOUNT_SID,
@@ -19,6 +18,23 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Shorter connect timeout + retries on every failure mode for the status webhook.
+# See twilio.com/docs/usage/webhooks/webhooks-connection-overrides
+CALLBACK_OVERRIDES = "#ct=3000&rt=1500&rc=5&rp=all"
+
+# Call states after which Twilio sends no further status updates
+TERMINAL_STATUSES = frozenset({"completed", "failed", "busy", "no-answer", "canceled"})
+
+# Rendered with str.format instead of walking twilio's VoiceResponse XML tree per call.
+_TWIML_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    "<Response><Connect>"
+    "<Stream url={stream_url}>"
+    '<Parameter name="scenario_id" value={scenario_id} />'
+    "</Stream>"
+    "</Connect></Response>"
+)
+
 _client: Client | None = None
 
 
@@ -36,21 +52,20 @@ def _build_twiml(public_url: str, scenario_id: str) -> str:
     The ``scenario_id`` is passed as a custom parameter so the server
     knows which patient persona to load.
     """
-    response = VoiceResponse()
-    connect = Connect()
     # Strip protocol for the WSS URL
-    ws_host = public_url.replace("https://", "").replace("http://", "")
-    stream = connect.stream(url=f"wss://{ws_host}/media-stream")
-    stream.parameter(name="scenario_id", value=scenario_id)
-    response.append(connect)
-    return str(response)
+    ws_host = public_url.removeprefix("https://").removeprefix("http://")
+    return _TWIML_TEMPLATE.format(
+        stream_url=quoteattr(f"wss://{ws_host}/media-stream"),
+        scenario_id=quoteattr(scenario_id),
+    )
 
 
-def make_call(public_url: str, scenario_id: str) -> str:
+async def make_call(public_url: str, scenario_id: str) -> str:
     """
     Place an outbound call to the target number.
 
-    Returns the Twilio Call SID.
+    The blocking Twilio request runs in a worker thread so the event loop
+    keeps servicing live media streams.  Returns the Twilio Call SID.
     """
     client = _get_client()
     twiml = _build_twiml(public_url, scenario_id)
@@ -59,7 +74,8 @@ def make_call(public_url: str, scenario_id: str) -> str:
         "Placing call → %s (scenario: %s)", TARGET_PHONE_NUMBER, scenario_id
     )
 
-    call = client.calls.create(
+    call = await asyncio.to_thread(
+        client.calls.create,
         to=TARGET_PHONE_NUMBER,
         from_=TWILIO_PHONE_NUMBER,
         twiml=twiml,
@@ -67,7 +83,7 @@ def make_call(public_url: str, scenario_id: str) -> str:
         time_limit=MAX_CALL_DURATION,
         record=True,
         recording_channels="dual",
-        status_callback=f"{public_url}/call-status",
+        status_callback=f"{public_url}/call-status{CALLBACK_OVERRIDES}",
         status_callback_event=["completed"],
     )
 
@@ -78,17 +94,13 @@ def make_call(public_url: str, scenario_id: str) -> str:
 async def hangup_call(call_sid: str) -> None:
     """End a call in progress (async-safe wrapper around sync Twilio client)."""
     client = _get_client()
-    loop = asyncio.get_running_loop()
-    await loop.run_in_executor(
-        None,
-        partial(client.calls(call_sid).update, status="completed"),
-    )
+    await asyncio.to_thread(client.calls(call_sid).update, status="completed")
 
 
-def get_call_status(call_sid: str) -> str:
-    """Fetch the current status of a call."""
+async def get_call_status(call_sid: str) -> str:
+    """Fetch the current status of a call (async-safe wrapper around sync Twilio client)."""
     client = _get_client()
-    call = client.calls(call_sid).fetch()
+    call = await asyncio.to_thread(client.calls(call_sid).fetch)
     return call.status
 
 
@@ -100,16 +112,15 @@ async def get_call_details(call_sid: str) -> dict | None:
     """
     try:
         client = _get_client()
-        loop = asyncio.get_running_loop()
-        call = await loop.run_in_executor(None, lambda: client.calls(call_sid).fetch())
+        call = await asyncio.to_thread(client.calls(call_sid).fetch)
         
         return {
             "sid": call.sid,
             "status": call.status,
             "duration": call.duration,  # seconds
             "direction": call.direction,
-            "start_time": str(call.start_time),
-            "end_time": str(call.end_time) if call.end_time else None,
+            "start_time": call.start_time.isoformat() if call.start_time else None,
+            "end_time": call.end_time.isoformat() if call.end_time else None,
             # Who ended the call: "caller" or "callee" (based on SIP BYE direction)
             "ended_by": getattr(call, "ended_by", None),
             # Twilio may provide these fields:
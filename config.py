@@ -3,6 +3,8 @@ Configuration management — loads settings from environment variables.
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -10,7 +12,6 @@ from dotenv import load_dotenv
 # Always load .env from the directory containing this file (project root).
 # So the app finds the same .env no matter where you start the server from.
 _env_path = Path(__file__).resolve().parent / ".env"
-load_dotenv(dotenv_path=_env_path)
 
 
 def _getenv(key: str, default: str = "") -> str:
@@ -18,48 +19,147 @@ def _getenv(key: str, default: str = "") -> str:
     return (os.getenv(key) or default).strip()
 
 
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Typed, immutable snapshot of every setting, parsed once per process."""
+
+    # ── Twilio ──────────────────────────────────────────────────────────
+    TWILIO_ACCOUNT_SID: str
+    TWILIO_AUTH_TOKEN: str
+    TWILIO_PHONE_NUMBER: str
+
+    # ── Target ──────────────────────────────────────────────────────────
+    TARGET_PHONE_NUMBER: str
+
+    # ── Deepgram ────────────────────────────────────────────────────────
+    DEEPGRAM_API_KEY: str
+    DEEPGRAM_STT_MODEL: str
+
+    # ── OpenAI ──────────────────────────────────────────────────────────
+    OPENAI_API_KEY: str
+    OPENAI_MODEL: str
+
+    # ── Server ──────────────────────────────────────────────────────────
+    SERVER_HOST: str
+    SERVER_PORT: int
+    PUBLIC_URL: str
+
+    # ── Call settings ───────────────────────────────────────────────────
+    MAX_CALL_DURATION: int
+    ENDPOINTING_MS: int
+    UTTERANCE_END_MS: int
+    RESPONSE_DELAY_MS: int
+    SPEECH_FINAL_DELAY_MS: int
+    SILENCE_KEEPALIVE_S: float
+    MEDIA_SILENCE_INTERVAL_MS: int
+    VAD_BARGE_IN_MS: int
+    STT_POOL_SIZE: int
+    DEBUG_TTS_AUDIO: bool
+    TRANSCRIPT_PRETTY_JSON: bool
+    TRANSCRIPT_WRITE_TXT: bool
+
+
+@lru_cache(maxsize=1)
+def _load() -> Settings:
+    """Read .env and the environment exactly once and cast every value."""
+    load_dotenv(dotenv_path=_env_path)
+    return Settings(
+        TWILIO_ACCOUNT_SID=_getenv("TWILIO_ACCOUNT_SID", ""),
+        TWILIO_AUTH_TOKEN=_getenv("TWILIO_AUTH_TOKEN", ""),
+        TWILIO_PHONE_NUMBER=_getenv("TWILIO_PHONE_NUMBER", ""),
+        TARGET_PHONE_NUMBER=_getenv("TARGET_PHONE_NUMBER", ""),
+        DEEPGRAM_API_KEY=_getenv("DEEPGRAM_API_KEY", ""),
+        DEEPGRAM_STT_MODEL=_getenv("DEEPGRAM_STT_MODEL", "nova-2-general"),
+        OPENAI_API_KEY=_getenv("OPENAI_API_KEY", ""),
+        OPENAI_MODEL=_getenv("OPENAI_MODEL", "gpt-4o-mini"),
+        SERVER_HOST=_getenv("SERVER_HOST", "0.0.0.0"),
+        SERVER_PORT=int(_getenv("SERVER_PORT", "8765")),
+        PUBLIC_URL=_getenv("PUBLIC_URL", ""),
+        MAX_CALL_DURATION=int(_getenv("MAX_CALL_DURATION", "300")),
+        ENDPOINTING_MS=int(_getenv("ENDPOINTING_MS", "1000")),
+        UTTERANCE_END_MS=int(_getenv("UTTERANCE_END_MS", "2400")),  # ms silence before we respond (longer = less mid-sentence cut-off)
+        RESPONSE_DELAY_MS=int(_getenv("RESPONSE_DELAY_MS", "200")),
+        SPEECH_FINAL_DELAY_MS=int(_getenv("SPEECH_FINAL_DELAY_MS", "1200")),
+        SILENCE_KEEPALIVE_S=float(_getenv("SILENCE_KEEPALIVE_S", "15")),
+        # How often to send silence to Twilio when we have no speech (keeps stream alive; prevents cutoffs)
+        MEDIA_SILENCE_INTERVAL_MS=int(_getenv("MEDIA_SILENCE_INTERVAL_MS", "100")),
+        # Local barge-in: ms of loud inbound audio during playback before we stop talking (0 = off, wait for STT)
+        VAD_BARGE_IN_MS=int(_getenv("VAD_BARGE_IN_MS", "0")),
+        # Pre-connected Deepgram STT sessions kept ready for the next call (0 = connect per call)
+        STT_POOL_SIZE=int(_getenv("STT_POOL_SIZE", "0")),
+        # Save each bot reply's raw μ-law audio under tts_audio_logs/ (debugging only)
+        DEBUG_TTS_AUDIO=_getenv("DEBUG_TTS_AUDIO", "0").lower() in ("1", "true", "yes"),
+        # Indent transcript JSON files (default compact; the .txt is the human-readable copy)
+        TRANSCRIPT_PRETTY_JSON=_getenv("TRANSCRIPT_PRETTY_JSON", "0").lower() in ("1", "true", "yes"),
+        # Write the .txt next to each transcript at call end (else: python -m transcript render ...)
+        TRANSCRIPT_WRITE_TXT=_getenv("TRANSCRIPT_WRITE_TXT", "1").lower() in ("1", "true", "yes"),
+    )
+
+
+cfg = _load()
+
 # ── Twilio ──────────────────────────────────────────────────────────────
-TWILIO_ACCOUNT_SID: str = _getenv("TWILIO_ACCOUNT_SID", "")
-TWILIO_AUTH_TOKEN: str = _getenv("TWILIO_AUTH_TOKEN", "")
-TWILIO_PHONE_NUMBER: str = _getenv("TWILIO_PHONE_NUMBER", "")
+TWILIO_ACCOUNT_SID: str = cfg.TWILIO_ACCOUNT_SID
+TWILIO_AUTH_TOKEN: str = cfg.TWILIO_AUTH_TOKEN
+TWILIO_PHONE_NUMBER: str = cfg.TWILIO_PHONE_NUMBER
 
 # ── Target ──────────────────────────────────────────────────────────────
-TARGET_PHONE_NUMBER: str = _getenv("TARGET_PHONE_NUMBER", "")
+TARGET_PHONE_NUMBER: str = cfg.TARGET_PHONE_NUMBER
 
 # ── Deepgram ────────────────────────────────────────────────────────────
-DEEPGRAM_API_KEY: str = _getenv("DEEPGRAM_API_KEY", "")
+DEEPGRAM_API_KEY: str = cfg.DEEPGRAM_API_KEY
+DEEPGRAM_STT_MODEL: str = cfg.DEEPGRAM_STT_MODEL
 
 # ── OpenAI ──────────────────────────────────────────────────────────────
-OPENAI_API_KEY: str = _getenv("OPENAI_API_KEY", "")
-OPENAI_MODEL: str = _getenv("OPENAI_MODEL", "gpt-4o-mini")
+OPENAI_API_KEY: str = cfg.OPENAI_API_KEY
+OPENAI_MODEL: str = cfg.OPENAI_MODEL
 
 # ── Server ──────────────────────────────────────────────────────────────
-SERVER_HOST: str = _getenv("SERVER_HOST", "0.0.0.0")
-SERVER_PORT: int = int(_getenv("SERVER_PORT", "8765"))
-PUBLIC_URL: str = _getenv("PUBLIC_URL", "")
+SERVER_HOST: str = cfg.SERVER_HOST
+SERVER_PORT: int = cfg.SERVER_PORT
+PUBLIC_URL: str = cfg.PUBLIC_URL
 
 # ── Call settings ───────────────────────────────────────────────────────
-MAX_CALL_DURATION: int = int(_getenv("MAX_CALL_DURATION", "300"))
-ENDPOINTING_MS: int = int(_getenv("ENDPOINTING_MS", "1000"))
-UTTERANCE_END_MS: int = int(_getenv("UTTERANCE_END_MS", "2400"))  # ms silence before we respond (longer = less mid-sentence cut-off)
-RESPONSE_DELAY_MS: int = int(_getenv("RESPONSE_DELAY_MS", "200"))
-SPEECH_FINAL_DELAY_MS: int = int(_getenv("SPEECH_FINAL_DELAY_MS", "1200"))
-SILENCE_KEEPALIVE_S: float = float(_getenv("SILENCE_KEEPALIVE_S", "15"))
-# How often to send silence to Twilio when we have no speech (keeps stream alive; prevents cutoffs)
-MEDIA_SILENCE_INTERVAL_MS: int = int(_getenv("MEDIA_SILENCE_INTERVAL_MS", "100"))
+MAX_CALL_DURATION: int = cfg.MAX_CALL_DURATION
+ENDPOINTING_MS: int = cfg.ENDPOINTING_MS
+UTTERANCE_END_MS: int = cfg.UTTERANCE_END_MS
+RESPONSE_DELAY_MS: int = cfg.RESPONSE_DELAY_MS
+SPEECH_FINAL_DELAY_MS: int = cfg.SPEECH_FINAL_DELAY_MS
+SILENCE_KEEPALIVE_S: float = cfg.SILENCE_KEEPALIVE_S
+MEDIA_SILENCE_INTERVAL_MS: int = cfg.MEDIA_SILENCE_INTERVAL_MS
+VAD_BARGE_IN_MS: int = cfg.VAD_BARGE_IN_MS
+STT_POOL_SIZE: int = cfg.STT_POOL_SIZE
+DEBUG_TTS_AUDIO: bool = cfg.DEBUG_TTS_AUDIO
+TRANSCRIPT_PRETTY_JSON: bool = cfg.TRANSCRIPT_PRETTY_JSON
+TRANSCRIPT_WRITE_TXT: bool = cfg.TRANSCRIPT_WRITE_TXT
+
+
+# Set once detection succeeds; a miss is retried on the next call
+_ngrok_url: str = ""
 
 
 def detect_ngrok_url() -> str:
-    """Auto-detect ngrok public URL by querying its local API."""
+    """
+    Auto-detect ngrok public URL by querying its local API.
+
+    A found URL is cached for the life of the process; a miss is not, so a
+    tunnel started after the server is picked up later.  This does blocking
+    I/O — from async code call it via ``await asyncio.to_thread(detect_ngrok_url)``.
+    """
+    global _ngrok_url
     if PUBLIC_URL:
         return PUBLIC_URL
+    if _ngrok_url:
+        return _ngrok_url
     try:
         import httpx
-        resp = httpx.get("http://localhost:4040/api/tunnels", timeout=2.0)
+        with httpx.Client(timeout=2.0) as client:
+            resp = client.get("http://localhost:4040/api/tunnels")
         tunnels = resp.json().get("tunnels", [])
         for tunnel in tunnels:
             if tunnel.get("proto") == "https":
-                return tunnel["public_url"]
+                _ngrok_url = tunnel["public_url"]
+                return _ngrok_url
     except Exception:
         pass
     return ""
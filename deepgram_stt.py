@@ -5,18 +5,52 @@ Streams raw μ-law audio from Twilio and returns transcription events.
 """
 
 import asyncio
-import json
+import contextlib
 import logging
+import time
+from collections import deque
 from enum import Enum
 from typing import Callable, Awaitable
 
+import orjson
 import websockets
 from websockets.asyncio.client import ClientConnection
 
-from config import DEEPGRAM_API_KEY, ENDPOINTING_MS, UTTERANCE_END_MS
+from config import (
+    DEEPGRAM_API_KEY,
+    DEEPGRAM_STT_MODEL,
+    ENDPOINTING_MS,
+    STT_POOL_SIZE,
+    UTTERANCE_END_MS,
+)
 
 logger = logging.getLogger(__name__)
 
+KEEPALIVE_INTERVAL_S = 8  # Deepgram closes idle streams after ~10 s
+
+# Twilio delivers 20 ms frames; coalesce them so we send ~5-10x fewer WS messages.
+AUDIO_BATCH_BYTES = 1600  # ~200 ms at 8 kHz μ-law
+AUDIO_FLUSH_INTERVAL_S = 0.1  # upper bound on batching delay
+
+# Control messages go out as text frames (binary frames are treated as audio)
+_KEEPALIVE_MSG = orjson.dumps({"type": "KeepAlive"}).decode()
+_CLOSE_MSG = orjson.dumps({"type": "CloseStream"}).decode()
+
+# Query string is fixed for the process lifetime, so build it once at import.
+# Only what the bot consumes is enabled: diarize, smart_format, utterances etc.
+# each add server-side latency and stay off.  Turn-taking relies on
+# endpointing + UtteranceEnd, so interim_results must stay on.
+_STT_URL = "wss://api.deepgram.com/v1/listen?" + "&".join([
+    "encoding=mulaw",
+    "sample_rate=8000",
+    "channels=1",
+    f"model={DEEPGRAM_STT_MODEL}",
+    "punctuate=true",
+    f"endpointing={ENDPOINTING_MS}",
+    "interim_results=true",
+    f"utterance_end_ms={UTTERANCE_END_MS}",
+])
+
 
 class SttEvent(Enum):
     FINAL = "final"              # is_final text, speech may continue
@@ -43,21 +77,15 @@ class DeepgramSTT:
         self._recv_task: asyncio.Task | None = None
         self._keepalive_task: asyncio.Task | None = None
 
+        # Outbound audio batching
+        self._audio_buffer = bytearray()
+        self._last_flush: float = 0.0
+
     # ── lifecycle ───────────────────────────────────────────────────────
 
     async def connect(self) -> None:
         """Open the WebSocket connection to Deepgram."""
-        params = "&".join([
-            "encoding=mulaw",
-            "sample_rate=8000",
-            "channels=1",
-            "model=nova-2-general",
-            "punctuate=true",
-            f"endpointing={ENDPOINTING_MS}",
-            "interim_results=true",
-            f"utterance_end_ms={UTTERANCE_END_MS}",
-        ])
-        url = f"wss://api.deepgram.com/v1/listen?{params}"
+        url = _STT_URL
 
         extra_headers = {"Authorization": f"Token {DEEPGRAM_API_KEY}"}
 
@@ -67,8 +95,9 @@ class DeepgramSTT:
             self._ws = await websockets.connect(
                 url,
                 additional_headers=extra_headers,
-                ping_interval=20,
-                ping_timeout=10,
+                # Deepgram only resets its idle timer on audio or a KeepAlive
+                # message, so _keepalive_loop is the sole keepalive timer.
+                ping_interval=None,
             )
         except websockets.exceptions.InvalidStatus as exc:
             logger.error(
@@ -82,6 +111,7 @@ class DeepgramSTT:
             raise
 
         self._running = True
+        self._last_flush = time.monotonic()
         self._recv_task = asyncio.create_task(self._receive_loop())
         self._keepalive_task = asyncio.create_task(self._keepalive_loop())
         logger.info("Deepgram STT connected")
@@ -91,7 +121,8 @@ class DeepgramSTT:
         self._running = False
         if self._ws:
             try:
-                await self._ws.send(json.dumps({"type": "CloseStream"}))
+                await self._flush_audio()
+                await self._ws.send(_CLOSE_MSG)
                 await self._ws.close()
             except Exception:
                 pass
@@ -101,15 +132,44 @@ class DeepgramSTT:
             self._keepalive_task.cancel()
         logger.info("Deepgram STT closed")
 
+    @property
+    def is_connected(self) -> bool:
+        """True while the stream is open and accepting audio."""
+        return self._running
+
+    def set_callback(self, on_transcript: TranscriptCallback) -> None:
+        """Route future transcripts to *on_transcript* (used when a pooled session is handed out)."""
+        self._on_transcript = on_transcript
+
     # ── audio input ─────────────────────────────────────────────────────
 
     async def send_audio(self, audio_bytes: bytes) -> None:
-        """Forward a chunk of μ-law audio to Deepgram."""
-        if self._ws and self._running:
-            try:
-                await self._ws.send(audio_bytes)
-            except Exception:
-                logger.warning("Failed to send audio to Deepgram")
+        """
+        Queue a chunk of μ-law audio for Deepgram.
+
+        Audio is batched and sent once ``AUDIO_BATCH_BYTES`` have accumulated
+        or ``AUDIO_FLUSH_INTERVAL_S`` has passed since the last send.
+        """
+        if not (self._ws and self._running):
+            return
+        self._audio_buffer += audio_bytes
+        if (
+            len(self._audio_buffer) >= AUDIO_BATCH_BYTES
+            or time.monotonic() - self._last_flush >= AUDIO_FLUSH_INTERVAL_S
+        ):
+            await self._flush_audio()
+
+    async def _flush_audio(self) -> None:
+        """Send any batched audio to Deepgram."""
+        if not self._audio_buffer or self._ws is None:
+            return
+        chunk = bytes(self._audio_buffer)
+        self._audio_buffer.clear()
+        self._last_flush = time.monotonic()
+        try:
+            await self._ws.send(chunk)
+        except Exception:
+            logger.warning("Failed to send audio to Deepgram")
 
     # ── internal loops ──────────────────────────────────────────────────
 
@@ -120,7 +180,7 @@ class DeepgramSTT:
             async for raw in self._ws:
                 if not self._running:
                     break
-                data = json.loads(raw)
+                data = orjson.loads(raw)
                 msg_type = data.get("type", "")
 
                 if msg_type == "Results":
@@ -144,13 +204,103 @@ class DeepgramSTT:
             self._running = False
 
     async def _keepalive_loop(self) -> None:
-        """Send periodic keepalive messages to prevent idle timeout."""
+        """
+        The stream's one background timer: flush batched audio that has
+        waited too long, and send KeepAlive when no audio has gone out
+        recently (prevents Deepgram's idle timeout).
+        """
         try:
             while self._running:
-                await asyncio.sleep(8)
-                if self._ws and self._running:
-                    await self._ws.send(json.dumps({"type": "KeepAlive"}))
+                await asyncio.sleep(AUDIO_FLUSH_INTERVAL_S)
+                if not (self._ws and self._running):
+                    continue
+                idle = time.monotonic() - self._last_flush
+                if self._audio_buffer and idle >= AUDIO_FLUSH_INTERVAL_S:
+                    await self._flush_audio()
+                elif idle >= KEEPALIVE_INTERVAL_S:
+                    self._last_flush = time.monotonic()
+                    await self._ws.send(_KEEPALIVE_MSG)
         except asyncio.CancelledError:
             pass
         except Exception:
-            pass
+            # This loop is the only liveness check (library pings are off),
+            # so a failed send means the stream is gone
+            logger.warning("Deepgram STT keepalive failed — marking session dead", exc_info=True)
+            self._running = False
+
+
+# ── warm session pool ───────────────────────────────────────────────────
+# Sessions are connected ahead of time and handed out once; a session that
+# carried a call is closed, never pooled again, so every call starts on a
+# fresh Deepgram stream.
+
+# An idle session older than this is closed instead of handed out, so the
+# pool never serves a stream that has sat on KeepAlives for minutes.
+STT_POOL_MAX_AGE_S = 300.0
+
+_pool: deque[tuple[float, DeepgramSTT]] = deque()  # (connected at, session)
+_refill_task: asyncio.Task | None = None
+
+
+async def _ignore_transcript(text: str, event: SttEvent) -> None:
+    """Placeholder callback for pooled sessions (they receive no audio)."""
+
+
+async def _refill() -> None:
+    while len(_pool) < STT_POOL_SIZE:
+        stt = DeepgramSTT(_ignore_transcript)
+        try:
+            await stt.connect()
+        except Exception:
+            logger.warning("Could not pre-connect Deepgram STT session", exc_info=True)
+            return
+        _pool.append((time.monotonic(), stt))
+
+
+def warm_pool() -> None:
+    """Top the pool up to ``STT_POOL_SIZE`` in the background (no-op when 0)."""
+    global _refill_task
+    if STT_POOL_SIZE and (_refill_task is None or _refill_task.done()):
+        _refill_task = asyncio.create_task(_refill())
+
+
+async def acquire(on_transcript: TranscriptCallback) -> DeepgramSTT:
+    """
+    Return a connected session for a new call.
+
+    Uses a pre-connected session when one is still open and younger than
+    ``STT_POOL_MAX_AGE_S``, skipping the TLS + WebSocket handshake; otherwise
+    connects a new one.  Dead or stale sessions are closed on the way.
+    """
+    stt: DeepgramSTT | None = None
+    now = time.monotonic()
+    while _pool:
+        connected_at, candidate = _pool.popleft()
+        # Deepgram may have dropped it meanwhile
+        if candidate.is_connected and now - connected_at < STT_POOL_MAX_AGE_S:
+            stt = candidate
+            break
+        await candidate.close()
+    warm_pool()
+
+    if stt is None:
+        stt = DeepgramSTT(on_transcript)
+        await stt.connect()
+    else:
+        stt.set_callback(on_transcript)
+        logger.info("Using pre-connected Deepgram STT session")
+    return stt
+
+
+async def close_pool() -> None:
+    """Close every idle pooled session (server shutdown)."""
+    global _refill_task
+    if _refill_task is not None:
+        # Let it unwind out of connect() before the caller tears down clients
+        _refill_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _refill_task
+        _refill_task = None
+    while _pool:
+        _, stt = _pool.popleft()
+        await stt.close()
@@ -17,6 +17,28 @@ logger = logging.getLogger(__name__)
 TTS_BASE_URL = "https://api.deepgram.com/v1/speak"
 CHUNK_SIZE = 3200  # ~200 ms of audio per yield (160 bytes = 20 ms)
 
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Shared client so every utterance reuses the same TLS connection to Deepgram."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(20.0),
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (called on server shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 def _build_headers() -> dict[str, str]:
     return {
@@ -38,16 +60,15 @@ async def synthesize(text: str, voice: str = "aura-asteria-en") -> bytes:
     """
     One-shot synthesis — returns complete μ-law audio bytes.
     """
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            TTS_BASE_URL,
-            params=_build_params(voice),
-            headers=_build_headers(),
-            json={"text": text},
-            timeout=15.0,
-        )
-        resp.raise_for_status()
-        return resp.content
+    resp = await _get_client().post(
+        TTS_BASE_URL,
+        params=_build_params(voice),
+        headers=_build_headers(),
+        json={"text": text},
+        timeout=15.0,
+    )
+    resp.raise_for_status()
+    return resp.content
 
 
 async def synthesize_stream(
@@ -61,15 +82,14 @@ async def synthesize_stream(
     This lets us start playing audio before synthesis finishes,
     dramatically reducing perceived latency.
     """
-    async with httpx.AsyncClient() as client:
-        async with client.stream(
-            "POST",
-            TTS_BASE_URL,
-            params=_build_params(voice),
-            headers=_build_headers(),
-            json={"text": text},
-            timeout=20.0,
-        ) as resp:
-            resp.raise_for_status()
-            async for chunk in resp.aiter_bytes(chunk_size=CHUNK_SIZE):
-                yield chunk
+    async with _get_client().stream(
+        "POST",
+        TTS_BASE_URL,
+        params=_build_params(voice),
+        headers=_build_headers(),
+        json={"text": text},
+        timeout=20.0,
+    ) as resp:
+        resp.raise_for_status()
+        async for chunk in resp.aiter_bytes(chunk_size=CHUNK_SIZE):
+            yield chunk
@@ -3,6 +3,10 @@ OpenAI LLM service — generates patient responses given conversation context.
 """
 
 import logging
+from functools import lru_cache
+from typing import AsyncIterator
+
+import httpx
 from openai import AsyncOpenAI
 from config import OPENAI_API_KEY, OPENAI_MODEL
 
@@ -14,16 +18,45 @@ _client: AsyncOpenAI | None = None
 def _get_client() -> AsyncOpenAI:
     global _client
     if _client is None:
-        _client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        # HTTP/2 multiplexes parallel scenario calls over one TLS connection
+        _client = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=50,
+                    max_connections=200,
+                    keepalive_expiry=90,
+                ),
+                timeout=httpx.Timeout(30.0, connect=3.0),
+            ),
+        )
     return _client
 
 
-async def get_patient_response(
+async def close_client() -> None:
+    """Close the shared OpenAI client (called on server shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+@lru_cache(maxsize=64)
+def _system_message(system_prompt: str) -> dict:
+    """One shared system message per scenario prompt (treat as read-only)."""
+    return {"role": "system", "content": system_prompt}
+
+
+async def stream_patient_response(
     conversation_history: list[dict],
     system_prompt: str,
-) -> str:
+) -> AsyncIterator[str]:
     """
-    Generate the next patient utterance.
+    Stream the next patient utterance token-by-token.
+
+    Lets the caller start TTS on the first complete sentence while the LLM
+    is still generating the rest.
 
     Parameters
     ----------
@@ -32,31 +65,65 @@ async def get_patient_response(
     system_prompt : str
         The scenario-specific persona instructions.
 
-    Returns
-    -------
+    Yields
+    ------
     str
-        The patient's next line of dialogue.  May contain ``[END_CALL]``
-        to signal the bot should hang up after speaking.
+        Text deltas as they arrive.  The concatenation may contain
+        ``[END_CALL]`` to signal the bot should hang up after speaking.
     """
     client = _get_client()
+    produced = False
 
-    messages = [{"role": "system", "content": system_prompt}]
-    messages.extend(conversation_history)
+    # Plain text rather than response_format=json_schema: a JSON envelope
+    # would hold back TTS until the object closes, and the [END_CALL] marker
+    # costs only a few tokens at the tail of the final sentence.
 
     try:
-        response = await client.chat.completions.create(
+        stream = await client.chat.completions.create(
             model=OPENAI_MODEL,
-            messages=messages,
+            messages=[_system_message(system_prompt), *conversation_history],
             max_tokens=200,
             temperature=0.8,
+            stream=True,
         )
-        text = response.choices[0].message.content or ""
-        if "[END_CALL]" in text:
-            logger.warning("LLM generated [END_CALL]: %s", text)
-        else:
-            logger.debug("LLM response: %s", text)
-        return text.strip()
+        # Close the HTTP response even when the consumer stops early
+        async with stream:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    produced = True
+                    yield delta
 
     except Exception:
         logger.exception("LLM request failed")
-        return "Sorry, could you repeat that?"
+        if not produced:
+            yield "Sorry, could you repeat that?"
+
+
+async def get_patient_response(
+    conversation_history: list[dict],
+    system_prompt: str,
+) -> str:
+    """
+    Generate the next patient utterance as a single string.
+
+    Thin wrapper over :func:`stream_patient_response` for callers that need
+    the full text at once.
+
+    Returns
+    -------
+    str
+        The patient's next line of dialogue.  May contain ``[END_CALL]``
+        to signal the bot should hang up after speaking.
+    """
+    text = "".join([
+        delta
+        async for delta in stream_patient_response(conversation_history, system_prompt)
+    ])
+    if "[END_CALL]" in text:
+        logger.warning("LLM generated [END_CALL]: %s", text)
+    else:
+        logger.debug("LLM response: %s", text)
+    return text.strip()
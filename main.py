@@ -7,17 +7,24 @@ FastAPI server that:
   • Bridges phone audio to the Deepgram + OpenAI AI pipeline
 """
 
-import json
+import asyncio
 import logging
 import os
 import sys
+from collections.abc import Mapping
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from fastapi import FastAPI, WebSocket, HTTPException, Request
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.responses import JSONResponse
+import orjson
 import uvicorn
 
 from config import SERVER_HOST, SERVER_PORT, detect_ngrok_url, validate_config
-from call_manager import make_call, get_call_status
+from call_manager import TERMINAL_STATUSES, make_call, get_call_status
+from deepgram_stt import close_pool as close_stt_pool, warm_pool as warm_stt_pool
+from deepgram_tts import close_client as close_tts_client
+from llm_service import close_client as close_llm_client
 from media_stream import MediaStreamHandler
 from scenarios import SCENARIOS, get_scenario, list_scenario_ids
 
@@ -29,20 +36,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger("voicebot")
 
-# ── FastAPI app ─────────────────────────────────────────────────────────
-app = FastAPI(
-    title="Pretty Good AI — Voice Bot Tester",
-    description="Automated voice bot that calls and tests the AI agent",
-)
-
 # Resolved at startup
 _public_url: str = ""
 
+# call_sid → final status, resolved by the Twilio status callback
+_call_results: dict[str, asyncio.Future[str]] = {}
+
+# Upper bound for one long-poll request on /call-status/{sid}/wait
+MAX_LONG_POLL_S = 300.0
+
+
+def _call_result(call_sid: str) -> asyncio.Future[str]:
+    """Future for *call_sid*'s final status (created by whichever side asks first)."""
+    fut = _call_results.get(call_sid)
+    if fut is None:
+        fut = _call_results[call_sid] = asyncio.get_running_loop().create_future()
+    return fut
 
-# ── Events ──────────────────────────────────────────────────────────────
 
-@app.on_event("startup")
-async def startup() -> None:
+def _drop_call_result(call_sid: str, fut: asyncio.Future[str]) -> None:
+    """Forget *call_sid*'s result, unless it has since been replaced."""
+    if _call_results.get(call_sid) is fut:
+        del _call_results[call_sid]
+
+
+# ── Lifespan ────────────────────────────────────────────────────────────
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     global _public_url
 
     # Validate required config
@@ -52,8 +73,8 @@ async def startup() -> None:
         logger.error("Copy .env.example → .env and fill in the values.")
         sys.exit(1)
 
-    # Resolve public URL (manual or auto-detect from ngrok)
-    _public_url = detect_ngrok_url()
+    # Resolve public URL (manual or auto-detect from ngrok; cached after first call)
+    _public_url = await asyncio.to_thread(detect_ngrok_url)
     if not _public_url:
         logger.error(
             "No PUBLIC_URL set and ngrok not detected. "
@@ -64,10 +85,39 @@ async def startup() -> None:
 
     logger.info("Server ready — public URL: %s", _public_url)
     logger.info("Available scenarios: %s", ", ".join(list_scenario_ids()))
+    warm_stt_pool()
+
+    yield
+
+    await close_stt_pool()
+    await close_tts_client()
+    await close_llm_client()
+
+
+# ── FastAPI app ─────────────────────────────────────────────────────────
+app = FastAPI(
+    title="Pretty Good AI — Voice Bot Tester",
+    description="Automated voice bot that calls and tests the AI agent",
+    lifespan=lifespan,
+)
 
 
 # ── WebSocket: Twilio Media Streams ─────────────────────────────────────
 
+async def _receive_json(websocket: WebSocket) -> dict:
+    """
+    orjson-backed ``WebSocket.receive_json``.
+
+    Parses text or binary frames straight from the ASGI message, so binary
+    frames skip the intermediate ``str`` allocation.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    raw = message.get("bytes")
+    return orjson.loads(raw if raw is not None else message["text"])
+
+
 @app.websocket("/media-stream")
 async def media_stream_endpoint(websocket: WebSocket) -> None:
     """
@@ -78,13 +128,12 @@ async def media_stream_endpoint(websocket: WebSocket) -> None:
     await websocket.accept()
     logger.info("Twilio WebSocket connected")
 
-    scenario: dict | None = None
+    scenario: Mapping[str, str] | None = None
 
     try:
         # Twilio sends "connected" first, then "start" with metadata
         while scenario is None:
-            raw = await websocket.receive_text()
-            data = json.loads(raw)
+            data = await _receive_json(websocket)
             event = data.get("event")
 
             if event == "start":
@@ -145,7 +194,7 @@ async def trigger_call(request: Request) -> JSONResponse:
         )
 
     try:
-        call_sid = make_call(_public_url, scenario_id)
+        call_sid = await make_call(_public_url, scenario_id)
     except Exception as exc:
         logger.exception("Failed to place call")
         raise HTTPException(500, f"Twilio error: {exc}") from exc
@@ -159,12 +208,37 @@ async def trigger_call(request: Request) -> JSONResponse:
 async def check_call_status(call_sid: str) -> JSONResponse:
     """Check the status of a call."""
     try:
-        status = get_call_status(call_sid)
+        status = await get_call_status(call_sid)
     except Exception as exc:
         raise HTTPException(404, f"Call not found: {exc}") from exc
     return JSONResponse({"call_sid": call_sid, "status": status})
 
 
+@app.get("/call-status/{call_sid}/wait")
+async def wait_call_status(call_sid: str, timeout: float = 60.0) -> JSONResponse:
+    """
+    Long-poll until the call reaches a terminal state.
+
+    Returns as soon as Twilio's status callback arrives.  On timeout, falls
+    back to a single REST lookup — with several workers the callback may
+    have landed in another process.
+    """
+    fut = _call_result(call_sid)
+    try:
+        async with asyncio.timeout(min(timeout, MAX_LONG_POLL_S)):
+            status = await asyncio.shield(fut)
+    except TimeoutError:
+        try:
+            status = await get_call_status(call_sid)
+        except Exception as exc:
+            raise HTTPException(404, f"Call not found: {exc}") from exc
+    finally:
+        # Whatever the outcome, this waiter is done with the entry; a later
+        # poll or callback simply creates a fresh one.
+        _drop_call_result(call_sid, fut)
+    return JSONResponse({"call_sid": call_sid, "status": status})
+
+
 @app.post("/call-status")
 async def call_status_webhook(request: Request) -> JSONResponse:
     """Twilio status callback webhook."""
@@ -173,6 +247,14 @@ async def call_status_webhook(request: Request) -> JSONResponse:
     status = form.get("CallStatus", "unknown")
     duration = form.get("CallDuration", "0")
     logger.info("Call %s → %s (duration: %ss)", call_sid, status, duration)
+    if status in TERMINAL_STATUSES:
+        fut = _call_result(call_sid)
+        if not fut.done():
+            fut.set_result(status)
+            # Nobody may ever poll for this call; don't keep it forever
+            asyncio.get_running_loop().call_later(
+                MAX_LONG_POLL_S, _drop_call_result, call_sid, fut
+            )
     return JSONResponse({"status": "ok"})
 
 
@@ -196,10 +278,16 @@ async def health() -> JSONResponse:
 if __name__ == "__main__":
     # Reload: restart server when code changes (dev only; set RELOAD=0 to disable)
     reload = os.environ.get("RELOAD", "1").strip().lower() in ("1", "true", "yes")
+    # Single process on purpose: call results, long-poll waiters and the STT
+    # pool live in this process's memory.  "auto" picks uvloop + httptools
+    # where uvicorn[standard] installed them (not on Windows).
     uvicorn.run(
         "main:app",
         host=SERVER_HOST,
         port=SERVER_PORT,
+        loop="auto",
+        http="auto",
+        ws="websockets",
         log_level="info",
         reload=reload,
     )
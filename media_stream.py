@@ -7,35 +7,55 @@ Bridges a Twilio Media Streams WebSocket connection to:
   • Deepgram TTS  (response → outbound audio)
 
 The handler owns the full lifecycle of a single phone call.
+
+Runs on the event loop chosen by the server entry point (``main.py`` starts
+uvicorn with ``loop="uvloop"``).  The real-time pacer in ``_audio_sender`` is
+timer-bound, so it benefits directly from uvloop's libuv timers.
 """
 
 import asyncio
-import base64
-import json
 import logging
 import os
+import re
 import time
+from collections import deque
+from contextlib import aclosing
+from collections.abc import Mapping
 from pathlib import Path
 
+import orjson
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
+try:  # SIMD (AVX2/NEON) base64 when the wheel is available
+    from pybase64 import b64decode, b64encode_as_string
+except ImportError:
+    import base64
+    from base64 import b64decode
+
+    def b64encode_as_string(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
 from config import (
+    DEBUG_TTS_AUDIO,
     RESPONSE_DELAY_MS,
     SPEECH_FINAL_DELAY_MS,
     SILENCE_KEEPALIVE_S,
     MEDIA_SILENCE_INTERVAL_MS,
     OPENAI_MODEL,
+    UTTERANCE_END_MS,
+    VAD_BARGE_IN_MS,
 )
-from deepgram_stt import DeepgramSTT, SttEvent
+from deepgram_stt import DeepgramSTT, SttEvent, acquire as acquire_stt
 from deepgram_tts import synthesize_stream
-from llm_service import get_patient_response
+from llm_service import stream_patient_response
 from transcript import TranscriptLogger
 
 logger = logging.getLogger(__name__)
 
-# Directory for TTS audio debug logs
+# Directory for TTS audio debug logs (only written with DEBUG_TTS_AUDIO=1)
 TTS_AUDIO_DIR = Path("tts_audio_logs")
-TTS_AUDIO_DIR.mkdir(exist_ok=True)
+if DEBUG_TTS_AUDIO:
+    TTS_AUDIO_DIR.mkdir(exist_ok=True)
 
 RESPONSE_DELAY = RESPONSE_DELAY_MS / 1000.0
 SPEECH_FINAL_DELAY = SPEECH_FINAL_DELAY_MS / 1000.0
@@ -49,6 +69,61 @@ KEEPALIVE_PROMPTS = [
 
 MULAW_FRAME_SIZE = 160  # 20 ms of μ-law audio at 8 kHz
 SILENCE_FRAME = b"\xff" * MULAW_FRAME_SIZE  # μ-law silence (0xFF = zero amplitude)
+_SILENCE_B64 = b64encode_as_string(SILENCE_FRAME)  # constant, so encoded once
+# Outbound audio goes to Twilio in 120 ms messages rather than one per 20 ms
+# frame.  960 bytes is a multiple of 3, so each batch base64-encodes without
+# padding and one bulk encode of a TTS chunk can be split on batch boundaries.
+BATCH_FRAMES = 6
+BATCH_BYTES = MULAW_FRAME_SIZE * BATCH_FRAMES
+BATCH_B64_LEN = BATCH_BYTES // 3 * 4
+
+# Sentences of one reply synthesized ahead of playback at most this many at a
+# time (per call), so TTS round-trips overlap with the audio already playing.
+TTS_CONCURRENCY = 3
+
+# Inbound digital silence keeps going to STT long enough for Deepgram to see the
+# pause and emit UtteranceEnd; after that it is dropped (STT KeepAlive holds the
+# socket open) until the caller makes a sound again.
+STT_SILENCE_HANGOVER_FRAMES = (UTTERANCE_END_MS + 1000) // 20
+_MULAW_SILENCE = (0xFF, 0x7F)  # +0 / -0
+
+
+def _mulaw_magnitude(b: int) -> int:
+    """|linear sample| (0–32124) of one G.711 μ-law byte."""
+    u = ~b & 0xFF
+    exponent = (u >> 4) & 0x07
+    mantissa = u & 0x0F
+    return (((mantissa << 3) + 0x84) << exponent) - 0x84
+
+
+# Local energy VAD for barge-in.  bytes.translate through this 256-entry table
+# maps each μ-law byte to 1 if its sample is loud, so one translate + count
+# (both C loops) gives the number of loud samples in a frame.
+VAD_LEVEL = 500  # linear amplitude, roughly -36 dBFS
+VAD_MIN_LOUD_SAMPLES = MULAW_FRAME_SIZE // 4
+# Rounded up to whole 20 ms frames, so any positive setting enables it
+VAD_BARGE_IN_FRAMES = -(-max(0, VAD_BARGE_IN_MS) // 20)
+_VAD_LOUD = bytes(int(_mulaw_magnitude(b) > VAD_LEVEL) for b in range(256))
+
+_MEDIA_MSG_SUFFIX = '"}}'  # closes the per-call media envelope prefix
+
+# Fast path for inbound media events: Twilio emits compact JSON, so the event
+# tag and the base64 payload (which never contains '"') can be found without a
+# full parse.  Anything else still goes through orjson.
+_MEDIA_EVENT_TAG = '"event":"media"'
+_MEDIA_PAYLOAD_RE = re.compile(r'"payload":"([^"]*)"')
+
+# Sentence boundary in streamed LLM output; requiring trailing whitespace
+# avoids splitting decimals and keeps the last sentence until the stream ends.
+# Common titles/abbreviations ("Dr. Smith at 10 a.m.") don't end a sentence,
+# so they aren't sent to TTS as separate fragments.
+_ABBREVIATIONS = (
+    "Dr", "Mr", "Mrs", "Ms", "St", "Jr", "Sr", "Ave", "Apt", "vs",
+    "e.g", "i.e", "a.m", "p.m", "A.M", "P.M",
+)
+_SENTENCE_END = re.compile(
+    "".join(rf"(?<!\b{re.escape(a)})" for a in _ABBREVIATIONS) + r"[.!?](?=\s)"
+)
 
 
 class MediaStreamHandler:
@@ -61,17 +136,20 @@ class MediaStreamHandler:
            asynchronously.
         3. When the remote speaker finishes an utterance (``speech_final``),
            we send the accumulated transcript to the LLM.
-        4. The LLM generates a patient response.
-        5. We stream that response through Deepgram TTS and send the resulting
-           μ-law audio back to Twilio.
+        4. The LLM streams a patient response.
+        5. Each complete sentence is sent through Deepgram TTS as soon as it
+           arrives and the resulting μ-law audio is streamed back to Twilio.
         6. If the LLM output contains ``[END_CALL]``, we hang up gracefully.
     """
 
-    def __init__(self, websocket: WebSocket, scenario: dict) -> None:
+    def __init__(self, websocket: WebSocket, scenario: Mapping[str, str]) -> None:
         self.ws = websocket
         self.scenario = scenario
 
         # Twilio identifiers (populated on "start" event)
+        self._media_msg_prefix: str = ""
+        self._silence_msg: str = ""
+        self._clear_msg: str = ""
         self.stream_sid: str | None = None
         self.call_sid: str | None = None
 
@@ -82,17 +160,30 @@ class MediaStreamHandler:
         )
 
         # Audio playback state
-        self._audio_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        # Single producer / single consumer: a deque plus a wake-up Event is
+        # all we need (None = end-of-utterance sentinel).
+        self._audio_buf: deque[str | None] = deque()
+        self._audio_ready = asyncio.Event()
         self._is_speaking = False
         self._barge_in = asyncio.Event()
 
         # STT
         self._stt: DeepgramSTT | None = None
         self._accumulated_text: str = ""
-
-        # Concurrency: prevent overlapping response generation
-        self._response_lock = asyncio.Lock()
+        self._silent_frames: int = 0  # consecutive all-silence inbound frames
+        self._voiced_frames: int = 0  # consecutive loud inbound frames during playback
+
+        # Concurrency: each reply captures the epoch it was started in and
+        # stops on its own once a newer utterance bumps it (no lock needed).
+        self._gen_epoch: int = 0
+        # Sentences of the in-flight reply already handed to playback; on
+        # supersede only these are recorded (None = nothing to record)
+        self._reply_spoken: list[str] | None = None
         self._speak_task: asyncio.Task | None = None
+        # Superseded replies still winding down; held so they aren't GC'd
+        # mid-flight and can be awaited at cleanup
+        self._retired_replies: set[asyncio.Task] = set()
+        self._tts_sem = asyncio.Semaphore(TTS_CONCURRENCY)
 
         # Silence keepalive
         self._last_activity: float = time.monotonic()
@@ -106,20 +197,38 @@ class MediaStreamHandler:
         self._websocket_close_code: int | None = None  # WebSocket close code (1000=normal, etc.)
         self._websocket_close_reason: str | None = None  # WebSocket close reason string
 
+    @property
+    def stream_sid(self) -> str | None:
+        return self._stream_sid
+
+    @stream_sid.setter
+    def stream_sid(self, sid: str | None) -> None:
+        self._stream_sid = sid
+        # The outbound media envelope is constant for the call — pre-render
+        # everything around the payload so each send is a string concat, and
+        # the silence and clear messages in full.
+        if not sid:
+            self._media_msg_prefix = self._silence_msg = self._clear_msg = ""
+            return
+        quoted = orjson.dumps(sid).decode()
+        self._media_msg_prefix = (
+            '{"event":"media","streamSid":%s,"media":{"payload":"' % quoted
+        )
+        self._silence_msg = self._media_msg_prefix + _SILENCE_B64 + _MEDIA_MSG_SUFFIX
+        self._clear_msg = '{"event":"clear","streamSid":%s}' % quoted
+
     # ── public entry point ──────────────────────────────────────────────
 
     async def run(self) -> None:
         """Drive the call from connect to hangup."""
-        self._stt = DeepgramSTT(self._on_transcript)
-
         try:
-            await self._stt.connect()
+            self._stt = await acquire_stt(self._on_transcript)
         except Exception:
             logger.exception("Failed to connect to Deepgram STT — call will end")
             self.transcript_logger.add_message(
                 "bot", "[SYSTEM ERROR: Deepgram STT connection failed]"
             )
-            self.transcript_logger.save()
+            await asyncio.to_thread(self.transcript_logger.save)
             return
 
         self._last_activity = time.monotonic()
@@ -155,14 +264,25 @@ class MediaStreamHandler:
                     break
 
                 msg_count += 1
-                data = json.loads(raw)
+
+                # "media" is ~98% of traffic: one substring test and one regex
+                # scan instead of building the whole object tree.  A frame the
+                # regex can't read falls through to the full parse below.
+                if _MEDIA_EVENT_TAG in raw:
+                    # Don't spend a decode on audio STT can't accept
+                    if self._stt is None or not self._stt.is_connected:
+                        continue
+                    m = _MEDIA_PAYLOAD_RE.search(raw)
+                    if m is not None:
+                        await self._handle_media(m.group(1))
+                        continue
+
+                data = orjson.loads(raw)
                 event = data.get("event")
 
                 if event == "media":
-                    payload = data["media"]["payload"]
-                    audio_bytes = base64.b64decode(payload)
-                    if self._stt:
-                        await self._stt.send_audio(audio_bytes)
+                    if self._stt is not None and self._stt.is_connected:
+                        await self._handle_media(data["media"]["payload"])
 
                 elif event == "start":
                     self.stream_sid = data["start"]["streamSid"]
@@ -221,6 +341,36 @@ class MediaStreamHandler:
                 logger.info("Call ended by remote side (not bot-initiated)")
             self._stop.set()
 
+    async def _handle_media(self, payload: str) -> None:
+        """Decode one inbound media frame, run local VAD, and forward it to STT."""
+        audio_bytes = b64decode(payload, validate=False)
+        if VAD_BARGE_IN_FRAMES and self._is_speaking:
+            if audio_bytes.translate(_VAD_LOUD).count(1) >= VAD_MIN_LOUD_SAMPLES:
+                self._voiced_frames += 1
+                if self._voiced_frames >= VAD_BARGE_IN_FRAMES:
+                    # Stop talking now; the reply is only replaced once STT
+                    # confirms actual words.
+                    logger.info("Local VAD barge-in — stopping playback")
+                    self._voiced_frames = 0
+                    await self._clear_audio()
+            else:
+                self._voiced_frames = 0
+        # bytes.count is a C memchr-style scan; a frame that is nothing but
+        # ±0 samples is digital silence.
+        if (
+            audio_bytes.count(_MULAW_SILENCE[0])
+            + audio_bytes.count(_MULAW_SILENCE[1])
+            == len(audio_bytes)
+        ):
+            self._silent_frames += 1
+            if self._silent_frames > STT_SILENCE_HANGOVER_FRAMES:
+                return
+        else:
+            self._silent_frames = 0
+        # DeepgramSTT coalesces frames into ~100-200 ms sends itself, so each
+        # 20 ms frame is handed over as-is.
+        await self._stt.send_audio(audio_bytes)
+
     # ── STT callback ────────────────────────────────────────────────────
 
     async def _on_transcript(self, text: str, event: SttEvent) -> None:
@@ -228,7 +378,7 @@ class MediaStreamHandler:
         Called by DeepgramSTT whenever a transcript result arrives.
 
         Strategy: only respond on UTTERANCE_END (long silence confirmed).
-        FINAL / SPEECH_FINAL just accumulate text and cancel any pending
+        FINAL / SPEECH_FINAL just accumulate text and supersede any pending
         response, since the agent may still be mid-turn with natural pauses
         between sentences.
         """
@@ -237,22 +387,41 @@ class MediaStreamHandler:
         if text:
             self._accumulated_text += (" " + text) if self._accumulated_text else text
             if self._speak_task and not self._speak_task.done():
-                self._speak_task.cancel()
-                self._speak_task = None
-            logger.debug("Accumulated: %s", self._accumulated_text)
+                # Barge-in: the in-flight reply sees the new epoch and returns
+                self._supersede_reply()
+                if self._is_speaking or self._audio_buf:
+                    await self._clear_audio()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Accumulated: %s", self._accumulated_text)
 
         if event == SttEvent.UTTERANCE_END and self._accumulated_text.strip():
             if self._speak_task and not self._speak_task.done():
-                self._speak_task.cancel()
+                self._supersede_reply()
             self._speak_task = asyncio.create_task(
-                self._delayed_respond(RESPONSE_DELAY)
+                self._delayed_respond(RESPONSE_DELAY, self._gen_epoch)
             )
 
-    async def _delayed_respond(self, delay: float) -> None:
+    def _supersede_reply(self) -> None:
+        """
+        Invalidate the in-flight reply (it returns on its own at the next
+        epoch check) and record the part of it that was actually played.
+
+        Recording happens here, synchronously, so it always lands in history
+        before the agent turn that superseded it.
+        """
+        self._gen_epoch += 1
+        spoken, self._reply_spoken = self._reply_spoken, None
+        if spoken:
+            self._record_bot_turn(" ".join(spoken))
+        task, self._speak_task = self._speak_task, None
+        if task is not None and not task.done():
+            self._retired_replies.add(task)
+            task.add_done_callback(self._retired_replies.discard)
+
+    async def _delayed_respond(self, delay: float, epoch: int) -> None:
         """Wait *delay* seconds, then log the agent's utterance and respond."""
-        try:
-            await asyncio.sleep(delay)
-        except asyncio.CancelledError:
+        await asyncio.sleep(delay)
+        if epoch != self._gen_epoch:
             return
 
         full_text = self._accumulated_text.strip()
@@ -266,7 +435,7 @@ class MediaStreamHandler:
         self.transcript_logger.add_message("agent", full_text)
         self.conversation_history.append({"role": "user", "content": full_text})
 
-        await self._generate_and_speak()
+        await self._generate_and_speak(epoch)
 
     # ── initial greeting ────────────────────────────────────────────
 
@@ -292,11 +461,11 @@ class MediaStreamHandler:
         voice = self.scenario.get("voice", "aura-asteria-en")
         self._is_speaking = True
         try:
+            pending = bytearray()
             async for chunk in synthesize_stream(greeting, voice):
-                for i in range(0, len(chunk), MULAW_FRAME_SIZE):
-                    frame = chunk[i : i + MULAW_FRAME_SIZE]
-                    await self._audio_queue.put(frame)
-            await self._audio_queue.put(None)
+                self._enqueue_tts_audio(chunk, pending)
+            self._flush_tts_audio(pending)
+            self._enqueue_audio(None)
         except Exception:
             logger.exception("Failed to send initial greeting")
             self._is_speaking = False
@@ -318,37 +487,94 @@ class MediaStreamHandler:
                 self._last_activity = time.monotonic()
                 voice = self.scenario.get("voice", "aura-asteria-en")
                 self._is_speaking = True
+                pending = bytearray()
                 async for chunk in synthesize_stream(prompt, voice):
-                    for i in range(0, len(chunk), MULAW_FRAME_SIZE):
-                        frame = chunk[i : i + MULAW_FRAME_SIZE]
-                        await self._audio_queue.put(frame)
-                await self._audio_queue.put(None)
+                    self._enqueue_tts_audio(chunk, pending)
+                self._flush_tts_audio(pending)
+                self._enqueue_audio(None)
 
     # ── response generation + TTS ───────────────────────────────────────
 
-    async def _generate_and_speak(self) -> None:
-        """Get LLM response, stream TTS audio to Twilio."""
-        try:
-            async with self._response_lock:
-                await self._do_generate_and_speak()
-        except asyncio.CancelledError:
-            logger.debug("Response generation cancelled (barge-in)")
-            await self._clear_audio()
-
-    async def _do_generate_and_speak(self) -> None:
-        """Inner logic for response generation (runs under lock)."""
+    async def _generate_and_speak(self, epoch: int) -> None:
+        """
+        Get LLM response, stream TTS audio to Twilio.
+
+        Returns early (without raising) as soon as ``self._gen_epoch`` moves
+        past *epoch*, i.e. the agent started a new utterance.
+        """
         # Interrupt any current playback (barge-in)
         await self._clear_audio()
 
+        response = ""  # full LLM text so far
+        pending = ""   # text not yet handed to TTS
+        spoke = False
+        spoken: list[str] = []  # sentences handed to playback so far
+        self._reply_spoken = spoken
+        # Each sentence gets its own chunk queue, filled by a prefetch task;
+        # the player drains them strictly in order.
+        sentences: asyncio.Queue[tuple[str, asyncio.Queue[bytes | None]] | None] = asyncio.Queue()
+        prefetch: list[asyncio.Task] = []
+        player: asyncio.Task | None = None
         try:
-            response = await get_patient_response(
-                self.conversation_history,
-                self.scenario["system_prompt"],
+            voice = self.scenario.get("voice", "aura-asteria-en")
+            self._barge_in.clear()
+
+            # Debug copy of this reply's audio — not buffered unless enabled
+            audio_bytes: bytearray | None = None
+            if DEBUG_TTS_AUDIO:
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                audio_log_path = (
+                    TTS_AUDIO_DIR
+                    / f"{timestamp}_{self.scenario['id']}_{len(self.conversation_history) + 1}.mulaw"
+                )
+                audio_bytes = bytearray()
+            player = asyncio.create_task(
+                self._play_sentences(sentences, spoken, audio_bytes, epoch)
             )
 
-            end_call = "[END_CALL]" in response
-            clean = response.replace("[END_CALL]", "").strip()
+            def speak(sentence: str) -> None:
+                text = sentence.replace("[END_CALL]", "").strip()
+                if not text:
+                    return
+                chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+                prefetch.append(
+                    asyncio.create_task(self._prefetch_sentence(text, voice, chunks))
+                )
+                sentences.put_nowait((text, chunks))
+
+            # Flush each complete sentence to TTS while the LLM keeps generating
+            # aclosing: an early return closes the LLM stream right away
+            async with aclosing(
+                stream_patient_response(
+                    self.conversation_history,
+                    self.scenario["system_prompt"],
+                )
+            ) as deltas:
+                async for delta in deltas:
+                    if epoch != self._gen_epoch:
+                        logger.debug("Response generation superseded (barge-in)")
+                        return
+                    if self._barge_in.is_set():
+                        # Local barge-in: nothing more will be spoken
+                        break
+                    response += delta
+                    pending += delta
+                    while m := _SENTENCE_END.search(pending):
+                        sentence, pending = pending[: m.end()], pending[m.end() :]
+                        speak(sentence)
+
+            if pending and not self._barge_in.is_set():
+                speak(pending)
+            sentences.put_nowait(None)
+            spoke = await player
+            if epoch != self._gen_epoch or self._barge_in.is_set():
+                # Cut off: the finally block records only what was played
+                return
+
+            self._reply_spoken = None
+            self._record_bot_turn(response)
 
+            end_call = "[END_CALL]" in response
             if end_call:
                 logger.warning(
                     "[END_CALL] detected in LLM response — bot will hang up. "
@@ -356,127 +582,222 @@ class MediaStreamHandler:
                     response,
                 )
 
-            if clean:
-                self.transcript_logger.add_message("bot", clean)
-                self.conversation_history.append(
-                    {"role": "assistant", "content": clean}
-                )
-
-                # Stream TTS audio into the playback queue + log to file
-                self._is_speaking = True
-                self._barge_in.clear()
-                voice = self.scenario.get("voice", "aura-asteria-en")
-
-                # Create audio log file for this utterance
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                audio_log_path = (
-                    TTS_AUDIO_DIR
-                    / f"{timestamp}_{self.scenario['id']}_{len(self.conversation_history)}.mulaw"
-                )
-                audio_bytes = bytearray()
+            if spoke:
+                # Sentinel: end-of-utterance
+                self._enqueue_audio(None)
 
-                async for chunk in synthesize_stream(clean, voice):
-                    if self._barge_in.is_set():
-                        logger.info("Barge-in detected — stopping TTS playback")
-                        break
-                    audio_bytes.extend(chunk)
-                    # Split into 20 ms frames for Twilio
-                    for i in range(0, len(chunk), MULAW_FRAME_SIZE):
-                        frame = chunk[i : i + MULAW_FRAME_SIZE]
-                        await self._audio_queue.put(frame)
-
-                # Save audio to file for debugging
-                if audio_bytes:
-                    with open(audio_log_path, "wb") as f:
-                        f.write(audio_bytes)
+            # Save audio to file for debugging (in a worker thread — replies
+            # can be hundreds of KB and the loop is pacing other calls' audio)
+            if audio_bytes:
+                await asyncio.to_thread(audio_log_path.write_bytes, audio_bytes)
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         "TTS audio saved → %s (%d bytes, text: %s)",
                         audio_log_path.name,
                         len(audio_bytes),
-                        clean[:50],
+                        response[:50],
                     )
 
-                # Sentinel: end-of-utterance
-                await self._audio_queue.put(None)
-
             if end_call:
                 logger.warning(
                     "Bot-initiated hangup: [END_CALL] signal — hanging up in 2 s"
                 )
                 await asyncio.sleep(2)
+                if epoch != self._gen_epoch:
+                    logger.warning("Hangup aborted — agent spoke again")
+                    return
                 await self._hangup()
 
         except Exception:
             logger.exception("Error in generate_and_speak")
 
+        finally:
+            for t in prefetch:
+                t.cancel()
+            if player is not None:
+                player.cancel()
+            # Ended early without being superseded (error, or playback cut
+            # by local barge-in): keep what was played.  A superseded reply
+            # was already recorded by _supersede_reply.
+            if self._reply_spoken is spoken:
+                self._reply_spoken = None
+                if spoken:
+                    self._record_bot_turn(" ".join(spoken))
+
+    def _record_bot_turn(self, response: str) -> None:
+        """Log the bot's utterance (minus the hangup marker) to transcript + history."""
+        clean = response.replace("[END_CALL]", "").strip()
+        if clean:
+            self.transcript_logger.add_message("bot", clean)
+            self.conversation_history.append({"role": "assistant", "content": clean})
+
+    async def _prefetch_sentence(
+        self, text: str, voice: str, chunks: asyncio.Queue[bytes | None]
+    ) -> None:
+        """Synthesize one sentence into *chunks*, ending with a ``None`` sentinel."""
+        try:
+            async with self._tts_sem:
+                async for chunk in synthesize_stream(text, voice):
+                    chunks.put_nowait(chunk)
+        except Exception:
+            logger.exception("TTS failed for sentence: %s", text[:50])
+        finally:
+            chunks.put_nowait(None)
+
+    async def _play_sentences(
+        self,
+        sentences: asyncio.Queue[tuple[str, asyncio.Queue[bytes | None]] | None],
+        spoken: list[str],
+        audio_bytes: bytearray | None,
+        epoch: int,
+    ) -> bool:
+        """
+        Move prefetched sentence audio into the playback queue, in order.
+
+        Each sentence's text is appended to *spoken* once its first audio is
+        queued.  Returns True if any sentence was queued.
+        """
+        spoke = False
+        while (item := await sentences.get()) is not None:
+            text, chunks = item
+            self._is_speaking = True
+            spoke = True
+            pending = bytearray()
+            started = False
+            while (chunk := await chunks.get()) is not None:
+                if self._barge_in.is_set() or epoch != self._gen_epoch:
+                    logger.info("Barge-in detected — stopping TTS playback")
+                    return spoke
+                if not started:
+                    spoken.append(text)
+                    started = True
+                if audio_bytes is not None:
+                    audio_bytes.extend(chunk)
+                self._enqueue_tts_audio(chunk, pending)
+            self._flush_tts_audio(pending)
+        return spoke
+
     # ── audio sender (Twilio outbound) ──────────────────────────────────
 
     async def _audio_sender(self) -> None:
         """
-        Pull frames from the audio queue and push them to Twilio at ~20 ms
-        intervals to maintain natural playback cadence.
+        Pull pre-encoded audio batches from the queue and push them to
+        Twilio, paced to real-time playback cadence.
 
         When the queue is empty, send silence frames at SILENCE_INTERVAL to keep
         the Twilio Media Stream (and any proxy/ngrok) alive and prevent cutoffs.
         """
         silence_interval = max(0.05, SILENCE_INTERVAL)  # at least 50 ms
-        while not self._stop.is_set():
-            try:
-                frame = await asyncio.wait_for(
-                    self._audio_queue.get(), timeout=silence_interval
-                )
-            except asyncio.TimeoutError:
-                # Send a silence frame to keep stream alive (prevents proxy/Twilio idle disconnect)
-                if self.stream_sid:
-                    await self._send_frame(SILENCE_FRAME)
-                continue
-
-            if frame is None:
+        loop = asyncio.get_running_loop()
+        next_send = loop.time()  # playback deadline for the next batch
+
+        # Hot loop runs ~10x/s per call: bind attributes to locals once
+        buf = self._audio_buf
+        popleft = buf.popleft
+        ready = self._audio_ready
+        stop = self._stop
+        send_payload = self._send_payload
+        send_silence = self._send_silence
+
+        while not stop.is_set():
+            if not buf:
+                ready.clear()
+                # asyncio.timeout only arms a timer handle — unlike wait_for it
+                # doesn't wrap the wait in a fresh Task every iteration.
+                try:
+                    async with asyncio.timeout(silence_interval):
+                        await ready.wait()
+                except TimeoutError:
+                    # Send a silence frame to keep stream alive (prevents proxy/Twilio idle disconnect)
+                    await send_silence()
+                    continue
+                if not buf:  # cleared by barge-in while we waited
+                    continue
+
+            payload = popleft()
+
+            if payload is None:
                 self._is_speaking = False
                 continue
 
-            await self._send_frame(frame)
-            await asyncio.sleep(0.02)
+            await send_payload(payload)
+            # Pace at real time (20 ms per 160 bytes of audio) against a
+            # deadline, so send time doesn't accumulate as drift.
+            next_send += 0.02 * (len(payload) * 3 // 4) / MULAW_FRAME_SIZE
+            now = loop.time()
+            if now - next_send > 0.1:
+                next_send = now  # fell far behind (or was idle) — don't burst to catch up
+            await asyncio.sleep(max(0.0, next_send - now))
+
+    def _enqueue_audio(self, item: str | None) -> None:
+        """Append a base64 payload (or the end-of-utterance ``None``) and wake the sender."""
+        self._audio_buf.append(item)
+        self._audio_ready.set()
+
+    def _enqueue_tts_audio(self, chunk: bytes, pending: bytearray) -> None:
+        """
+        Add a TTS chunk to *pending* and enqueue every complete batch.
 
-    async def _send_frame(self, frame: bytes) -> None:
-        """Send a single audio frame to Twilio."""
-        if not self.stream_sid:
+        All whole batches are base64-encoded in one call, then split on
+        ``BATCH_B64_LEN`` boundaries — the sender does no encoding at all.
+        The partial tail stays in *pending* for the next chunk.
+        """
+        pending += chunk
+        n = len(pending) - len(pending) % BATCH_BYTES
+        if not n:
             return
-        payload = base64.b64encode(frame).decode("ascii")
-        msg = {
-            "event": "media",
-            "streamSid": self.stream_sid,
-            "media": {"payload": payload},
-        }
+        encoded = b64encode_as_string(memoryview(pending)[:n])
+        del pending[:n]
+        for i in range(0, len(encoded), BATCH_B64_LEN):
+            self._enqueue_audio(encoded[i : i + BATCH_B64_LEN])
+
+    def _flush_tts_audio(self, pending: bytearray) -> None:
+        """Enqueue whatever partial batch is left at the end of an utterance."""
+        if pending:
+            self._enqueue_audio(b64encode_as_string(pending))
+            pending.clear()
+
+    async def _send_payload(self, payload: str) -> None:
+        """Send one already-base64-encoded media message to Twilio."""
+        prefix = self._media_msg_prefix
+        if not prefix:  # no streamSid yet
+            return
+        msg = prefix + payload + _MEDIA_MSG_SUFFIX
         try:
-            await self.ws.send_json(msg)
+            # Raw ASGI send: skips the send_text wrapper on the per-frame path
+            await self.ws.send({"type": "websocket.send", "text": msg})
         except Exception:
             logger.warning("Failed to send audio frame to Twilio")
 
+    async def _send_silence(self) -> None:
+        """Send the call's pre-rendered silence message."""
+        if not self._silence_msg:  # no streamSid yet
+            return
+        try:
+            await self.ws.send({"type": "websocket.send", "text": self._silence_msg})
+        except Exception:
+            logger.warning("Failed to send silence frame to Twilio")
+
     # ── barge-in / clear ────────────────────────────────────────────────
 
     async def _clear_audio(self) -> None:
         """Flush the playback queue and tell Twilio to clear its buffer."""
         self._barge_in.set()
 
-        # Drain the queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        # Drop everything not yet sent — one C-level clear, and the sender
+        # must not wake for items that are gone.  The end-of-utterance
+        # sentinel went with them, so reset the speaking flag here.
+        self._audio_buf.clear()
+        self._audio_ready.clear()
+        self._is_speaking = False
 
         # Ask Twilio to drop any buffered audio
-        if self.stream_sid:
+        if self._clear_msg:
             try:
-                await self.ws.send_json(
-                    {"event": "clear", "streamSid": self.stream_sid}
-                )
+                await self.ws.send_text(self._clear_msg)
             except Exception:
                 pass
 
-        self._is_speaking = False
-
     # ── call control ────────────────────────────────────────────────────
 
     async def _hangup(self) -> None:
@@ -504,6 +825,7 @@ class MediaStreamHandler:
     async def _cleanup(self) -> None:
         """Release resources and persist the transcript."""
         self._stop.set()
+        self._supersede_reply()  # stop any reply still in flight
 
         # ----- DEBUG: Unmissable call-end summary (check SERVER terminal, not test runner) -----
         ended_by = "bot" if self._bot_initiated_hangup else "remote"
@@ -562,13 +884,22 @@ class MediaStreamHandler:
             if not t.done():
                 t.cancel()
 
+        # Replies already superseded above; wait for them to unwind so none
+        # touches the transcript after it is saved
+        retired = list(self._retired_replies)
+        for t in retired:
+            t.cancel()
+        await asyncio.gather(*retired, return_exceptions=True)
+
         remaining = self._accumulated_text.strip()
         if remaining:
             logger.info("Agent said (end-of-call): %s", remaining)
             self.transcript_logger.add_message("agent", remaining)
             self._accumulated_text = ""
 
-        self.transcript_logger.save()
+        # JSON/TXT serialization and disk IO run in a worker thread so
+        # concurrent hangups don't stall the event loop for every other call.
+        await asyncio.to_thread(self.transcript_logger.save)
 
         logger.info(
             "Call finished — scenario=%s, messages=%d, ended_by=%s, reason=%s",
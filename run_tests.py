@@ -12,6 +12,9 @@ Usage:
     # Run with shorter wait between calls:
     python run_tests.py --wait 60
 
+    # Run up to 3 calls at once:
+    python run_tests.py --parallel 3
+
     # List available scenarios:
     python run_tests.py --list
 """
@@ -21,11 +24,17 @@ import asyncio
 import logging
 import sys
 import time
+from collections.abc import Mapping, Sequence
 
 import httpx
 
-from scenarios import SCENARIOS, list_scenario_ids
-from call_manager import get_call_status
+try:  # libuv-based loop when available; the server already runs under it
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from scenarios import SCENARIOS, get_scenario, list_scenario_ids
+from call_manager import TERMINAL_STATUSES
 
 logging.basicConfig(
     level=logging.INFO,
@@ -35,19 +44,38 @@ logging.basicConfig(
 logger = logging.getLogger("test_runner")
 
 
-async def wait_for_completion(call_sid: str, timeout: int = 300) -> str:
-    """Poll Twilio until the call reaches a terminal state."""
-    start = time.time()
-    terminal = {"completed", "failed", "busy", "no-answer", "canceled"}
+# Seconds per long-poll request; the server answers early when the call ends
+LONG_POLL_S = 60
 
-    while time.time() - start < timeout:
+
+async def wait_for_completion(
+    client: httpx.AsyncClient,
+    base_url: str,
+    call_sid: str,
+    timeout: int = 300,
+) -> str:
+    """
+    Wait until the call reaches a terminal state.
+
+    Long-polls the server, which resolves the wait from Twilio's status
+    callback instead of this process polling the Twilio API.
+    """
+    deadline = time.monotonic() + timeout
+
+    while (remaining := deadline - time.monotonic()) > 0:
+        poll = min(LONG_POLL_S, remaining)
         try:
-            status = get_call_status(call_sid)
-            if status in terminal:
+            resp = await client.get(
+                f"{base_url}/call-status/{call_sid}/wait",
+                params={"timeout": poll},
+                timeout=poll + 10,
+            )
+            resp.raise_for_status()
+            status = resp.json()["status"]
+            if status in TERMINAL_STATUSES:
                 return status
         except Exception:
-            pass
-        await asyncio.sleep(5)
+            await asyncio.sleep(5)
 
     return "timeout"
 
@@ -55,7 +83,7 @@ async def wait_for_completion(call_sid: str, timeout: int = 300) -> str:
 async def run_scenario(
     client: httpx.AsyncClient,
     base_url: str,
-    scenario: dict,
+    scenario: Mapping[str, str],
     index: int,
     total: int,
 ) -> dict:
@@ -78,7 +106,7 @@ async def run_scenario(
         print(f"  Call SID : {call_sid}")
         print(f"  Waiting for call to complete...")
 
-        status = await wait_for_completion(call_sid, timeout=300)
+        status = await wait_for_completion(client, base_url, call_sid, timeout=300)
         elapsed = time.time() - start
 
         print(f"  Status   : {status}")
@@ -110,13 +138,15 @@ async def run_scenario(
 
 
 async def run_all(
-    scenarios: list[dict],
+    scenarios: Sequence[Mapping[str, str]],
     base_url: str,
     wait_between: int,
+    parallel: int = 1,
 ) -> None:
-    """Run all selected scenarios sequentially."""
+    """Run the selected scenarios, at most *parallel* calls at a time."""
     total = len(scenarios)
-    results: list[dict] = []
+    sem = asyncio.Semaphore(max(1, parallel))
+    started = 0
 
     print(f"\nStarting {total} test call(s) against {base_url}")
     print(f"Target: Pretty Good AI test line (+1-805-439-8008)\n")
@@ -132,14 +162,22 @@ async def run_all(
             print(f"Make sure it's running: python main.py")
             sys.exit(1)
 
-        for i, scenario in enumerate(scenarios, 1):
-            result = await run_scenario(client, base_url, scenario, i, total)
-            results.append(result)
-
-            # Pause between calls (Twilio rate limiting + natural spacing)
-            if i < total:
-                print(f"\n  Pausing {wait_between}s before next call...")
-                await asyncio.sleep(wait_between)
+        async def guarded(i: int, scenario: Mapping[str, str]) -> dict:
+            nonlocal started
+            async with sem:
+                started += 1
+                result = await run_scenario(client, base_url, scenario, i, total)
+                # Pause before this slot's next call (Twilio rate limiting +
+                # natural spacing); skipped once nothing is left to start.
+                if started < total:
+                    print(f"\n  Pausing {wait_between}s before next call...")
+                    await asyncio.sleep(wait_between)
+                return result
+
+        # gather keeps results in scenario order for the summary
+        results = await asyncio.gather(
+            *(guarded(i, s) for i, s in enumerate(scenarios, 1))
+        )
 
     # ── Summary ─────────────────────────────────────────────────────────
     print(f"\n{'='*64}")
@@ -178,6 +216,12 @@ def main() -> None:
         default=15,
         help="Seconds to wait between calls (default: 15)",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Number of calls to run at the same time (default: 1)",
+    )
     parser.add_argument(
         "--list",
         action="store_true",
@@ -201,11 +245,12 @@ def main() -> None:
                 print(f"Unknown scenario: {sid}")
                 print(f"Available: {', '.join(sorted(all_ids))}")
                 sys.exit(1)
-            selected.append(next(s for s in SCENARIOS if s["id"] == sid))
+            selected.append(get_scenario(sid))
     else:
         selected = SCENARIOS
 
-    asyncio.run(run_all(selected, args.url, args.wait))
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(run_all(selected, args.url, args.wait, args.parallel))
 
 
 if __name__ == "__main__":
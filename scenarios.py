@@ -3,8 +3,14 @@ Patient scenario definitions for testing the Pretty Good AI voice agent.
 
 Each scenario simulates a different type of patient call to stress-test
 scheduling, refills, triage, billing, and edge-case handling.
+
+Scenarios are read-only: ``SCENARIOS`` is a tuple of mapping proxies, so a
+handler can't accidentally modify a definition shared by every call.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 BASE_INSTRUCTIONS = """
 IMPORTANT RULES:
 - Keep every response to 1–3 short sentences. You are on a phone call, not writing an essay.
@@ -16,7 +22,7 @@ IMPORTANT RULES:
 - If you have been talking for a while and things seem to be going in circles, politely wrap up and include [END_CALL].
 """
 
-SCENARIOS: list[dict] = [
+_SCENARIO_DEFS: list[dict[str, str]] = [
     # ── 1. New Patient Scheduling ───────────────────────────────────────
     {
         "id": "new_patient_scheduling",
@@ -430,11 +436,20 @@ Start by saying "Hi, yeah, I need to schedule something — actually wait, do yo
 ]
 
 
-def get_scenario(scenario_id: str) -> dict | None:
+SCENARIOS: tuple[Mapping[str, str], ...] = tuple(
+    MappingProxyType(s) for s in _SCENARIO_DEFS
+)
+
+_BY_ID: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {s["id"]: s for s in SCENARIOS}
+)
+
+
+def get_scenario(scenario_id: str) -> Mapping[str, str] | None:
     """Look up a scenario by its ID."""
-    return next((s for s in SCENARIOS if s["id"] == scenario_id), None)
+    return _BY_ID.get(scenario_id)
 
 
 def list_scenario_ids() -> list[str]:
-    """Return all available scenario IDs."""
-    return [s["id"] for s in SCENARIOS]
+    """Return all available scenario IDs (definition order)."""
+    return list(_BY_ID)
@@ -1,10 +1,11 @@
-import openai
-
 def test_openai_key():
     # 1. Get the API key from the user
     api_key = input("Enter your OpenAI API key: ").strip()
     
-    # 2. Initialize the client
+    # 2. Initialize the client (openai is imported here so the script starts,
+    #    and test collection imports it, without loading the SDK)
+    import openai
+
     client = openai.OpenAI(api_key=api_key)
     
     # 3. Ask a test question
@@ -4,23 +4,104 @@ Conversation transcript logger.
 Stores both sides of each call in JSON (machine-readable) and TXT
 (human-readable) formats. Each scenario has its own subdirectory under
 ``transcripts/``, e.g. ``transcripts/cancel_appointment/``.
+
+The TXT file is rendered from the JSON payload, so it can also be produced
+after the fact (e.g. with ``TRANSCRIPT_WRITE_TXT=0``)::
+
+    python -m transcript render transcripts/cancel_appointment/<file>.json
 """
 
-import json
 import os
 import logging
-from datetime import datetime
+import sys
+import time
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+import orjson
+
+from config import TRANSCRIPT_PRETTY_JSON, TRANSCRIPT_WRITE_TXT
 
 logger = logging.getLogger(__name__)
 
 TRANSCRIPTS_DIR = "transcripts"
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 if TRANSCRIPT_PRETTY_JSON else 0
+
+_AGENT_LABEL = "AI Agent (PrettyGoodAI)"
+_TXT_HEADER = (
+    "Call Transcript — {name}\n"
+    "Date     : {date}\n"
+    "Duration : {duration:.1f}s\n"
+    "Scenario : {scenario_id}\n"
+    + "=" * 64
+    + "\n\n"
+)
 
+
+# Directories already created by this process (one makedirs per scenario)
+_ENSURED_DIRS: set[str] = set()
+
+
+@lru_cache(maxsize=64)
 def _scenario_dir(scenario_id: str) -> str:
     """Return transcripts subdirectory for this scenario (e.g. transcripts/cancel_appointment)."""
     return os.path.join(TRANSCRIPTS_DIR, scenario_id)
 
 
+def _ensure_dir(path: str) -> None:
+    """``os.makedirs(path, exist_ok=True)``, skipped for directories already made."""
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+@lru_cache(maxsize=16)
+def _speaker_labels(model_name: str, pad_agent: bool = False) -> Mapping[str, str]:
+    """
+    Display labels by speaker, built once per model (e.g. "gpt-4o-mini" ->
+    "Patient Bot (GPT-4O-MINI)").  *pad_agent* lines the agent label up with
+    the bot label, as in the TXT files.
+    """
+    agent = _AGENT_LABEL + "  " if pad_agent else _AGENT_LABEL
+    return MappingProxyType({"agent": agent, "bot": f"Patient Bot ({model_name.upper()})"})
+
+
+def _txt_lines(payload: dict) -> list[str]:
+    """Render a transcript payload (as saved to JSON) to TXT lines."""
+    lines = [
+        _TXT_HEADER.format(
+            name=payload["scenario_name"],
+            date=datetime.fromisoformat(payload["start_time"]).strftime("%Y-%m-%d %H:%M:%S"),
+            duration=payload["duration_seconds"],
+            scenario_id=payload["scenario_id"],
+        )
+    ]
+    # Agent label padded to line up with the bot label, as before.  The
+    # lookup is bound to a local so the per-message loop does no attribute
+    # or global access.
+    labels = _speaker_labels(payload.get("model_name", "gpt-4o-mini"), pad_agent=True)
+    bot_label = labels["bot"]
+    label_of = labels.get
+    lines.extend(
+        f"[{label_of(msg['speaker'], bot_label)}]: {msg['text']}\n\n"
+        for msg in payload["messages"]
+    )
+    return lines
+
+
+def render_txt(json_path: str) -> str:
+    """Write the TXT transcript next to a saved JSON transcript.  Returns its path."""
+    with open(json_path, "rb") as f:
+        payload = orjson.loads(f.read())
+    txt_path = os.path.splitext(json_path)[0] + ".txt"
+    with open(txt_path, "w") as f:
+        f.writelines(_txt_lines(payload))
+    return txt_path
+
+
 class TranscriptLogger:
     """
     Accumulates messages during a call and persists them on :meth:`save`.
@@ -32,7 +113,9 @@ class TranscriptLogger:
         self.model_name = model_name  # OpenAI model used for patient bot (e.g. "gpt-4o", "gpt-4o-mini")
         self.messages: list[dict] = []
         self.start_time = datetime.now()
-        os.makedirs(_scenario_dir(scenario_id), exist_ok=True)
+        self._t0_ns = time.perf_counter_ns()  # message offsets are relative to this
+        self._labels = _speaker_labels(model_name)
+        _ensure_dir(_scenario_dir(scenario_id))
 
     def add_message(self, speaker: str, text: str) -> None:
         """
@@ -45,20 +128,23 @@ class TranscriptLogger:
         text : str
             What was said.
         """
+        # Only a monotonic offset is taken here; it becomes an ISO timestamp in save()
         entry = {
             "speaker": speaker,
             "text": text,
-            "timestamp": datetime.now().isoformat(),
+            "offset_ns": time.perf_counter_ns() - self._t0_ns,
         }
         self.messages.append(entry)
-        # Format model name for display (e.g. "gpt-4o" -> "GPT-4o", "gpt-4o-mini" -> "GPT-4o-mini")
-        model_display = self.model_name.upper()
-        label = "AI Agent (PrettyGoodAI)" if speaker == "agent" else f"Patient Bot ({model_display})"
-        logger.info("[%s] %s", label, text)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[%s] %s", self._labels.get(speaker, self._labels["bot"]), text)
 
     def save(self) -> str:
-        """Write JSON + TXT transcript files.  Returns the JSON file path."""
-        end_time = datetime.now()
+        """Write JSON (+ TXT unless disabled) transcript files.  Returns the JSON file path."""
+        # Same monotonic clock as the message offsets, so end_time never lands
+        # before the last message even if the wall clock steps mid-call
+        end_time = self.start_time + timedelta(
+            microseconds=(time.perf_counter_ns() - self._t0_ns) // 1000
+        )
         duration = (end_time - self.start_time).total_seconds()
         timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
 
@@ -76,23 +162,25 @@ class TranscriptLogger:
             "end_time": end_time.isoformat(),
             "duration_seconds": round(duration, 1),
             "message_count": len(self.messages),
-            "messages": self.messages,
+            "messages": [
+                {
+                    "speaker": msg["speaker"],
+                    "text": msg["text"],
+                    "timestamp": (
+                        self.start_time + timedelta(microseconds=msg["offset_ns"] // 1000)
+                    ).isoformat(),
+                }
+                for msg in self.messages
+            ],
         }
-        with open(json_path, "w") as f:
-            json.dump(payload, f, indent=2)
+        with open(json_path, "wb") as f:
+            f.write(orjson.dumps(payload, option=_JSON_OPTIONS))
 
         # ── Human-readable TXT ──────────────────────────────────────────
-        with open(txt_path, "w") as f:
-            f.write(f"Call Transcript — {self.scenario_name}\n")
-            f.write(f"Date     : {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Duration : {duration:.1f}s\n")
-            f.write(f"Scenario : {self.scenario_id}\n")
-            f.write("=" * 64 + "\n\n")
-            # Format model name for display
-            model_display = self.model_name.upper()
-            for msg in self.messages:
-                label = "AI Agent (PrettyGoodAI)  " if msg["speaker"] == "agent" else f"Patient Bot ({model_display})"
-                f.write(f"[{label}]: {msg['text']}\n\n")
+        # Built in memory and written in one call rather than per message
+        if TRANSCRIPT_WRITE_TXT:
+            with open(txt_path, "w") as f:
+                f.writelines(_txt_lines(payload))
 
         logger.info(
             "Transcript saved → %s (%d messages, %.1fs)",
@@ -101,3 +189,10 @@ class TranscriptLogger:
             duration,
         )
         return json_path
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] != "render":
+        sys.exit("usage: python -m transcript render <transcript.json> ...")
+    for path in sys.argv[2:]:
+        print(render_txt(path))